@@ -127,6 +127,10 @@ class AdminChannels(commands.Cog):
                 },
                 upsert=True
             )
+
+            # Route log events to the new channel without waiting for the cache to expire
+            if getattr(self.bot, 'unified_log_parser', None):
+                self.bot.unified_log_parser.invalidate_guild_cfg(guild_id)
             
             # Create success embed
             embed = discord.Embed(
@@ -221,6 +225,9 @@ class AdminChannels(commands.Cog):
                 {"guild_id": guild_id},
                 {"$set": clear_update}
             )
+
+            if getattr(self.bot, 'unified_log_parser', None):
+                self.bot.unified_log_parser.invalidate_guild_cfg(guild_id)
             
             # Create confirmation embed
             embed = discord.Embed(
@@ -425,7 +425,7 @@ class Parsers(commands.Cog):
             test_content = "\n".join(sample_logs[:lines])
 
             # Parse the test content
-            embeds = await parser.parse_log_content(test_content, str(ctx.guild_id), "test_server")
+            events = await parser.parse_log_content(test_content.encode('utf-8'), str(ctx.guild_id), "test_server")
 
             # Get parser status
             status = parser.get_parser_status()
@@ -445,7 +445,7 @@ class Parsers(commands.Cog):
 
             embed.add_field(
                 name="Results",
-                value=f"**Events Parsed:** {len(embeds)}\n**Parser Status:** ✅ Working",
+                value=f"**Events Parsed:** {len(events)}\n**Parser Status:** ✅ Working",
                 inline=False
             )
 
@@ -457,13 +457,15 @@ class Parsers(commands.Cog):
 
             await ctx.followup.send(embed=embed)
 
-            # Send any generated embeds
-            if embeds:
-                for event_embed in embeds[:3]:  # Limit to first 3 to avoid spam
-                    await ctx.followup.send(embed=event_embed)
+            # Send embeds for the parsed events
+            if events:
+                for event in events[:3]:  # Limit to first 3 to avoid spam
+                    event_embed = parser.create_event_embed(event)
+                    if event_embed:
+                        await ctx.followup.send(embed=event_embed)
 
-                if len(embeds) > 3:
-                    await ctx.followup.send(f"... and {len(embeds) - 3} more events")
+                if len(events) > 3:
+                    await ctx.followup.send(f"... and {len(events) - 3} more events")
 
         except Exception as e:
             logger.error(f"Test log parser error: {e}")
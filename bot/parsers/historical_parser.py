@@ -15,7 +15,9 @@ import asyncssh
 import discord
 from discord.ext import commands
 
-from .killfeed_parser import KillfeedParser
+from .killfeed_parser import (
+    KillfeedParser, SFTP_KEEPALIVE_COUNT_MAX, SFTP_KEEPALIVE_INTERVAL, SFTP_READ_BLOCK_SIZE, SFTP_READ_MAX_REQUESTS
+)
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +111,8 @@ class HistoricalParser:
                         'client_keys': None,  # No client keys needed with password auth
                         'preferred_auth': 'password,keyboard-interactive',
                         'kex_algs': [
+                            'curve25519-sha256',
+                            'curve25519-sha256@libssh.org',
                             'diffie-hellman-group14-sha256',
                             'diffie-hellman-group16-sha512',
                             'diffie-hellman-group18-sha512',
@@ -125,7 +129,9 @@ class HistoricalParser:
                         'mac_algs': [
                             'hmac-sha2-256', 'hmac-sha2-512',
                             'hmac-sha1'
-                        ]
+                        ],
+                        'keepalive_interval': SFTP_KEEPALIVE_INTERVAL,
+                        'keepalive_count_max': SFTP_KEEPALIVE_COUNT_MAX
                     }
 
                     # Establish connection with timeout
@@ -245,27 +251,18 @@ class HistoricalParser:
 
                         # Use chunked reading for large files to prevent memory issues
                         buffer_size = 1024 * 1024  # 1MB buffer
-                        file_content = ""
+                        chunks = []
 
-                        async with sftp.open(filepath, 'r') as f:
+                        async with sftp.open(filepath, 'rb', block_size=SFTP_READ_BLOCK_SIZE,
+                                             max_requests=SFTP_READ_MAX_REQUESTS) as f:
                             while True:
                                 chunk = await f.read(buffer_size)
                                 if not chunk:
                                     break
+                                chunks.append(chunk)
 
-                                # Handle binary data if needed
-                                if isinstance(chunk, bytes):
-                                    try:
-                                        chunk = chunk.decode('utf-8')
-                                    except UnicodeDecodeError:
-                                        try:
-                                            # Try alternative encoding
-                                            chunk = chunk.decode('latin-1')
-                                        except Exception:
-                                            logger.warning(f"Failed to decode content in {filepath}")
-                                            continue
-
-                                file_content += chunk
+                        # Decode once - chunk boundaries can split multi-byte characters
+                        file_content = b''.join(chunks).decode('utf-8', 'replace')
 
                         # Process file content line by line
                         valid_lines = [line.strip() for line in file_content.splitlines() if line.strip()]
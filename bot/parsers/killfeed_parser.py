@@ -10,9 +10,10 @@ import os
 import re
 import glob
 import stat
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, AsyncIterator
 
 import aiofiles
 import discord
@@ -21,6 +22,21 @@ from discord.ext import commands
 
 logger = logging.getLogger(__name__)
 
+# SFTP reads are pipelined as 64 KiB requests with up to 256 in flight, so
+# high-latency links stay saturated instead of waiting on each round trip
+SFTP_READ_BLOCK_SIZE = 65536
+SFTP_READ_MAX_REQUESTS = 256
+
+# Idle SFTP clients kept open per SSH connection for reuse across polls
+SFTP_CLIENTS_PER_CONNECTION = 4
+
+# SFTP errors that mean the channel itself is unusable, as opposed to a status reply
+SFTP_CHANNEL_ERRORS = (asyncssh.SFTPConnectionLost, asyncssh.SFTPBadMessage)
+
+# SSH keepalives every 30s; a session is dropped after 3 unanswered probes
+SFTP_KEEPALIVE_INTERVAL = 30
+SFTP_KEEPALIVE_COUNT_MAX = 3
+
 class KillfeedParser:
     """
     KILLFEED PARSER (FREE)
@@ -37,6 +53,7 @@ class KillfeedParser:
         self.parsed_lines: Dict[str, Set[str]] = {}  # Track parsed lines per server
         self.last_file_position: Dict[str, int] = {}  # Track file position per server
         self.sftp_pool: Dict[str, asyncssh.SSHClientConnection] = {}  # SFTP connection pool
+        self.sftp_clients: Dict[asyncssh.SSHClientConnection, List[asyncssh.SFTPClient]] = {}  # idle SFTP clients per connection
         self.pool_cleanup_timeout = 300  # 5 minutes idle timeout
 
     async def parse_csv_line(self, line: str) -> Optional[Dict[str, Any]]:
@@ -133,6 +150,7 @@ class KillfeedParser:
                         del self.sftp_pool[pool_key]
                 except Exception:
                     del self.sftp_pool[pool_key]
+                self.sftp_clients.pop(conn, None)
 
             # Create new connection with retry/backoff
             for attempt in range(3):
@@ -145,9 +163,12 @@ class KillfeedParser:
                             port=sftp_port, 
                             known_hosts=None,
                             server_host_key_algs=['ssh-rsa', 'rsa-sha2-256', 'rsa-sha2-512'],
-                            kex_algs=['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512', 'ecdh-sha2-nistp256', 'ecdh-sha2-nistp384', 'ecdh-sha2-nistp521'],
+                            kex_algs=['curve25519-sha256', 'curve25519-sha256@libssh.org', 'diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512', 'ecdh-sha2-nistp256', 'ecdh-sha2-nistp384', 'ecdh-sha2-nistp521'],
                             encryption_algs=['aes128-ctr', 'aes192-ctr', 'aes256-ctr', 'aes128-gcm@openssh.com', 'aes256-gcm@openssh.com'],
-                            mac_algs=['hmac-sha2-256', 'hmac-sha2-512', 'hmac-sha1']
+                            mac_algs=['hmac-sha2-256', 'hmac-sha2-512', 'hmac-sha1'],
+                            # Keep pooled sessions alive between polls so an idle drop doesn't force a new handshake
+                            keepalive_interval=SFTP_KEEPALIVE_INTERVAL,
+                            keepalive_count_max=SFTP_KEEPALIVE_COUNT_MAX
                         ),
                         timeout=30
                     )
@@ -166,6 +187,27 @@ class KillfeedParser:
             logger.error(f"Failed to get SFTP connection: {e}")
             return None
 
+    @asynccontextmanager
+    async def sftp_client(self, conn: asyncssh.SSHClientConnection) -> AsyncIterator[asyncssh.SFTPClient]:
+        """
+        Borrow an SFTP client on a pooled connection
+        Idle clients are reused so a poll skips the SFTP subsystem handshake;
+        concurrent borrowers get their own channel instead of queueing on one
+        """
+        idle = self.sftp_clients.setdefault(conn, [])
+        sftp = idle.pop() if idle else await conn.start_sftp_client()
+        try:
+            yield sftp
+        except BaseException:
+            # The channel may be in a bad state - don't hand it out again
+            sftp.exit()
+            raise
+
+        if conn.is_closed() or len(idle) >= SFTP_CLIENTS_PER_CONNECTION:
+            sftp.exit()
+        else:
+            idle.append(sftp)
+
     async def get_sftp_csv_files(self, server_config: Dict[str, Any]) -> List[str]:
         """Get CSV files from SFTP server using AsyncSSH with connection pooling"""
         try:
@@ -179,7 +221,10 @@ class KillfeedParser:
             remote_path = f"./{sftp_host}_{server_id}/actual1/deathlogs/"
             logger.info(f"Using SFTP CSV path: {remote_path} for server {server_id} on host {sftp_host}")
 
-            async with conn.start_sftp_client() as sftp:
+            # Only SFTP status replies (missing file, permission denied) are handled
+            # inside the block - a lost or broken channel must escape the
+            # async with so the client is exited instead of returned to the pool
+            async with self.sftp_client(conn) as sftp:
                 csv_files = []
                 # Use consistent path pattern
                 pattern = f"./{sftp_host}_{server_id}/actual1/deathlogs/**/*.csv"
@@ -198,9 +243,13 @@ class KillfeedParser:
                                 csv_files.append((path, mtime))
                                 seen_paths.add(path)
                                 logger.debug(f"Found CSV file: {path}")
-                            except Exception as e:
+                            except SFTP_CHANNEL_ERRORS:
+                                raise
+                            except asyncssh.SFTPError as e:
                                 logger.warning(f"Error processing CSV file {path}: {e}")
-                except Exception as e:
+                except SFTP_CHANNEL_ERRORS:
+                    raise
+                except asyncssh.SFTPError as e:
                     logger.error(f"Failed to glob files: {e}")
 
                 if not csv_files:
@@ -213,10 +262,15 @@ class KillfeedParser:
 
                 # Read file content
                 try:
-                    async with sftp.open(most_recent_file, 'r') as f:
-                        file_content = await f.read()
+                    async with sftp.open(most_recent_file, 'rb', block_size=SFTP_READ_BLOCK_SIZE,
+                                         max_requests=SFTP_READ_MAX_REQUESTS) as f:
+                        # Player names can be non-Latin, so decode as UTF-8; a stray
+                        # invalid byte must not cost the whole file
+                        file_content = (await f.read()).decode('utf-8', 'replace')
                         return [line.strip() for line in file_content.splitlines() if line.strip()]
-                except Exception as e:
+                except SFTP_CHANNEL_ERRORS:
+                    raise
+                except asyncssh.SFTPError as e:
                     logger.error(f"Failed to read CSV file {most_recent_file}: {e}")
                     return []
 
@@ -545,6 +599,7 @@ class KillfeedParser:
             for pool_key, conn in list(self.sftp_pool.items()):
                 if conn._transport.is_closing() or not conn.is_client():
                     del self.sftp_pool[pool_key]
+                    self.sftp_clients.pop(conn, None)
                     logger.info(f"Cleaned up stale SFTP connection: {pool_key}")
         except Exception as e:
             logger.error(f"Failed to cleanup SFTP connections: {e}")
\ No newline at end of file
@@ -7,15 +7,20 @@ PHASE 1 & 2 Complete Implementation
 """
 
 import asyncio
+import functools
 import logging
 import os
 import re
 import hashlib
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, AsyncIterator
 
 import aiofiles
+import aiofiles.os
 import discord
 import asyncssh
 from discord.ext import commands
@@ -24,6 +29,238 @@ from bot.utils.embed_factory import EmbedFactory
 
 logger = logging.getLogger(__name__)
 
+# Mission difficulty tiers by id keyword - the highest tier found in the id wins
+_MISSION_TIER_KEYWORDS = {
+    'military': 5, 'bunker': 5, 'khimmash': 5,      # High tier
+    'airport': 4, 'promzone': 4, 'kamensk': 4,      # High-medium tier
+    'ind_': 3, 'industrial': 3,                     # Medium tier
+    'sawmill': 2, 'lighthouse': 2, 'elevator': 2,   # Low-medium tier
+}
+_MISSION_TIER_PATTERN = re.compile('|'.join(map(re.escape, _MISSION_TIER_KEYWORDS)))
+
+# Mission embed presentation by state - (title, description template, color)
+_MISSION_STATE_CFG = {
+    'READY': ("🎯 Mission Available", "**{name}** is now available for completion", 0x00FF00),
+    'IN_PROGRESS': ("⚔️ Mission In Progress", "**{name}** is currently being completed", 0xFFAA00),
+    'COMPLETED': ("✅ Mission Completed", "**{name}** has been completed successfully", 0x0099FF),
+    'RESPAWN': ("🔄 Mission Respawning", "**{name}** will respawn in {respawn_time} seconds", 0x888888),
+}
+_DEFAULT_MISSION_CFG = ("📋 Mission Update", "**{name}** state: {state}", 0x666666)
+_MISSION_FOOTER = "Mission Event • Powered by Discord.gg/EmeraldServers"
+
+# Connection embed presentation by event type - (title, description template, color)
+_CONNECTION_CFG = {
+    'player_connection': ("🟢 Player Connected", "**{name}** has joined the server", 0x00FF00),
+    'player_disconnection': ("🔴 Player Disconnected", "**{name}** has left the server", 0xFF0000),
+}
+_CONNECTION_FOOTER = "Connection Event • Powered by Discord.gg/EmeraldServers"
+
+# Discord accepts at most 10 embeds in a single message
+_EMBEDS_PER_MESSAGE = 10
+
+# Log data is read in 1 MiB chunks so memory stays bounded by the chunk, not the file
+_READ_CHUNK_SIZE = 1 << 20
+
+# Seconds a cached guild config is reused for channel routing
+_GUILD_CFG_TTL = 30.0
+
+# Servers parsed concurrently per run - bounds open log files
+_MAX_CONCURRENT_SERVERS = 16
+
+# Discord messages in flight at once across all servers
+_MAX_CONCURRENT_SENDS = 20
+
+# Upper bound in seconds on the state writer's backoff after failed writes
+_STATE_RETRY_MAX_DELAY = 60.0
+
+
+@dataclass(slots=True)
+class PlayerSession:
+    """Connection session for one player in one guild"""
+    player_id: str
+    player_name: str
+    guild_id: str
+    joined_at: str
+    status: str = 'online'
+    left_at: Optional[str] = None
+
+
+@dataclass(slots=True)
+class PlayerLifecycle:
+    """Name captured from a queue join request, used when the player registers"""
+    name: str
+    queue_joined: str
+
+
+@dataclass(slots=True)
+class FileState:
+    """Incremental read position for one server log"""
+    byte_offset: Optional[int] = None  # None for states saved before byte offsets were tracked
+    head_hash: Optional[str] = None
+    line_count: int = 0
+    last_updated: Optional[str] = None
+    mtime: Optional[float] = None  # log mtime when the offset was resolved - unchanged size and mtime skip the poll
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FileState':
+        """Build from a persisted state document"""
+        return cls(
+            byte_offset=data.get('byte_offset'),
+            head_hash=data.get('head_hash'),
+            line_count=data.get('line_count', 0),
+            last_updated=data.get('last_updated'),
+            mtime=data.get('mtime')
+        )
+
+
+def _count_lines(data: bytes) -> int:
+    """Count lines in raw log data, including a trailing line without a newline"""
+    line_count = data.count(b'\n')
+    if data and not data.endswith(b'\n'):
+        line_count += 1
+    return line_count
+
+
+def _offset_after_lines(data: bytes, line_count: int) -> int:
+    """Byte offset just past the first line_count lines of data"""
+    offset = 0
+    for _ in range(line_count):
+        newline = data.find(b'\n', offset)
+        if newline < 0:
+            return len(data)
+        offset = newline + 1
+    return offset
+
+
+@functools.lru_cache(maxsize=4096)
+def _mission_tier(mission_id: str) -> int:
+    """Resolve a mission tier with one scan of the lowercased id (1 = low tier)"""
+    return max(
+        (_MISSION_TIER_KEYWORDS[match[0]] for match in _MISSION_TIER_PATTERN.finditer(mission_id.lower())),
+        default=1
+    )
+
+
+# Comprehensive log patterns from actual Deadside.log analysis (bytes patterns, matched on raw log data)
+# The log prefixes have fixed casing, so patterns match case-sensitively and hex
+# EOS IDs take both cases in their character class instead of re.IGNORECASE
+_PATTERNS: Dict[str, re.Pattern] = {
+    # SERVER LIFECYCLE
+    'log_rotation': re.compile(rb'^Log file open, (\d{2}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})'),
+    'server_startup': re.compile(rb'LogWorld: Bringing World.*up for play.*at (\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})'),
+    'world_loaded': re.compile(rb'LogLoad: Took .* seconds to LoadMap.*World_0'),
+    'server_max_players': re.compile(rb'playersmaxcount=(\d+)', re.IGNORECASE),
+
+    # PLAYER CONNECTION LIFECYCLE - From actual log patterns
+    'player_queue_join': re.compile(rb'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?.*eosid=\|([a-fA-F0-9]+).*Name=([^&\?\r\n]+)'),
+    'player_beacon_join': re.compile(rb'LogBeacon: Beacon Join SFPSOnlineBeaconClient EOS:\|([a-fA-F0-9]+)'),
+    'player_registered': re.compile(rb'LogOnline: Warning: Player \|([a-fA-F0-9]+) successfully registered!'),
+    'player_disconnect': re.compile(rb'UChannel::Close: Sending CloseBunch.*UniqueId: EOS:\|([a-fA-F0-9]+)'),
+    'player_cleanup': re.compile(rb'UNetConnection::Close: Connection cleanup.*UniqueId: EOS:\|([a-fA-F0-9]+)'),
+
+    # MISSION EVENTS - Patterns from actual Deadside.log
+    'mission_respawn': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) will respawn in (\d+)'),
+    'mission_state_change': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to ([A-Z_]+)'),
+    'mission_ready': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to READY'),
+    'mission_initial': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to INITIAL'),
+    'mission_in_progress': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to IN_PROGRESS'),
+    'mission_completed': re.compile(rb'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to COMPLETED'),
+
+    # VEHICLE EVENTS
+    'vehicle_spawn': re.compile(rb'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)'),
+    'vehicle_delete': re.compile(rb'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)'),
+
+    # TIMESTAMP EXTRACTION
+    'timestamp': re.compile(rb'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\]')
+}
+
+# Patterns that produce events - each one has a _handle_<name> method on the parser -
+# mapped to a literal every line it can match must contain
+_HANDLED_PATTERNS: Dict[str, bytes] = {
+    'mission_respawn': b'LogSFPS: Mission ',
+    'mission_state_change': b'LogSFPS: Mission ',
+    'player_queue_join': b'LogNet: Join request: ',
+    'player_registered': b' successfully registered!',
+    'player_disconnect': b'UChannel::Close: ',
+}
+
+# Distinct pre-filter literals - a substring test is far cheaper than a regex search
+_EVENT_LITERALS: Tuple[bytes, ...] = tuple(dict.fromkeys(_HANDLED_PATTERNS.values()))
+
+# Complete mission normalization from actual Deadside.log analysis -
+# maps all discovered mission IDs to proper readable names
+_MISSION_MAPPINGS: Dict[str, str] = {
+    # Airport Missions
+    'GA_Airport_mis_01_SFPSACMission': 'Airport Mission #1',
+    'GA_Airport_mis_02_SFPSACMission': 'Airport Mission #2', 
+    'GA_Airport_mis_03_SFPSACMission': 'Airport Mission #3',
+    'GA_Airport_mis_04_SFPSACMission': 'Airport Mission #4',
+
+    # Settlement Missions
+    'GA_Beregovoy_Mis1': 'Beregovoy Settlement Mission',
+    'GA_Settle_05_ChernyLog_Mis1': 'Cherny Log Settlement Mission',
+    'GA_Settle_09_Mis_1': 'Settlement Mission #9',
+
+    # Military Base Missions
+    'GA_Military_02_Mis1': 'Military Base Mission #2',
+    'GA_Military_03_Mis_01': 'Military Base Mission #3',
+    'GA_Military_04_Mis1': 'Military Base Mission #4',
+    'GA_Military_04_Mis_2': 'Military Base Mission #4B',
+
+    # Industrial Missions
+    'GA_Ind_01_m1': 'Industrial Zone Mission #1',
+    'GA_Ind_02_Mis_1': 'Industrial Zone Mission #2',
+    'GA_PromZone_6_Mis_1': 'Industrial Zone Mission #6',
+    'GA_PromZone_Mis_01': 'Industrial Zone Mission A',
+    'GA_PromZone_Mis_02': 'Industrial Zone Mission B',
+
+    # Chemical Plant Missions
+    'GA_KhimMash_Mis_01': 'Chemical Plant Mission #1',
+    'GA_KhimMash_Mis_02': 'Chemical Plant Mission #2',
+
+    # City Missions
+    'GA_Kamensk_Ind_3_Mis_1': 'Kamensk Industrial Mission',
+    'GA_Kamensk_Mis_1': 'Kamensk City Mission #1',
+    'GA_Kamensk_Mis_2': 'Kamensk City Mission #2', 
+    'GA_Kamensk_Mis_3': 'Kamensk City Mission #3',
+    'GA_Krasnoe_Mis_1': 'Krasnoe City Mission',
+    'GA_Vostok_Mis_1': 'Vostok City Mission',
+
+    # Special Locations
+    'GA_Bunker_01_Mis1': 'Underground Bunker Mission',
+    'GA_Lighthouse_02_Mis1': 'Lighthouse Mission #2',
+    'GA_Elevator_Mis_1': 'Elevator Complex Mission #1',
+    'GA_Elevator_Mis_2': 'Elevator Complex Mission #2',
+
+    # Resource Missions
+    'GA_Sawmill_01_Mis1': 'Sawmill Mission #1',
+    'GA_Sawmill_02_1_Mis1': 'Sawmill Mission #2A',
+    'GA_Sawmill_03_Mis_01': 'Sawmill Mission #3',
+    'GA_Bochki_Mis_1': 'Barrel Storage Mission',
+    'GA_Dubovoe_0_Mis_1': 'Dubovoe Resource Mission',
+}
+
+
+def _compile_combined_pattern(patterns: Dict[str, re.Pattern], names) -> Tuple[re.Pattern, Dict[str, int]]:
+    """
+    Fuse the handled patterns into one named-group alternation
+    Returns the compiled pattern and each name's group index, so handlers
+    can read their own capture groups as match[offset + n]
+    """
+    alternatives = []
+    for name, pattern in patterns.items():
+        if name not in names:
+            continue
+        alternatives.append(b"(?P<" + name.encode('ascii') + b">" + pattern.pattern + b")")
+
+    combined = re.compile(b"|".join(alternatives))
+    return combined, dict(combined.groupindex)
+
+
+# Each line is scanned once by the combined alternation and dispatched on match.lastgroup
+_COMBINED_PATTERN, _GROUP_OFFSETS = _compile_combined_pattern(_PATTERNS, _HANDLED_PATTERNS)
+
+
 class UnifiedLogParser:
     """
     UNIFIED LOG PARSER - Consolidates all log parsing functionality
@@ -33,119 +270,75 @@ class UnifiedLogParser:
     - Maintains guild isolation logic
     """
 
+    # Fixed attribute set - slot access skips the instance __dict__ on hot paths
+    __slots__ = (
+        'bot', 'last_log_position', 'log_file_hashes', 'player_sessions', 'server_status',
+        'sftp_connections', 'file_states', 'player_lifecycle',
+        'patterns', 'combined_pattern', '_dispatch',
+        'mission_mappings', '_normalized_names',
+        '_dirty', '_flush_event', '_state_flush_interval', '_state_retry_delay', '_state_writer_task',
+        '_pending_voice_updates', '_voice_tasks', '_send_tasks', '_send_semaphore', '_guild_cfg_cache'
+    )
+
     def __init__(self, bot):
         self.bot = bot
-        # All state dictionaries use guild_server keys for complete isolation
-        self.last_log_position: Dict[str, int] = {}  # {guild_id}_{server_id} -> position
-        self.log_file_hashes: Dict[str, str] = {}    # {guild_id}_{server_id} -> hash
-        self.player_sessions: Dict[str, Dict[str, Any]] = {}  # {guild_id}_{player_id} -> session_data
-        self.server_status: Dict[str, Dict[str, Any]] = {}    # {guild_id}_{server_id} -> status
-        self.sftp_connections: Dict[str, asyncssh.SSHClientConnection] = {}  # {guild_id}_{server_id}_{host}_{port} -> connection
-        self.file_states: Dict[str, Dict[str, Any]] = {}      # {guild_id}_{server_id} -> file_state
-        self.player_lifecycle: Dict[str, Dict[str, Any]] = {} # {guild_id}_{player_id} -> lifecycle_data
-
-        # Comprehensive log patterns from actual Deadside.log analysis
-        self.patterns = self._compile_unified_patterns()
+        # All state dictionaries are keyed by guild_id first for complete isolation -
+        # guild cleanup is a single pop and per-guild queries only touch that guild
+        self.last_log_position: Dict[str, Dict[str, int]] = {}  # guild_id -> server_id -> position
+        self.log_file_hashes: Dict[str, Dict[str, str]] = {}    # guild_id -> server_id -> hash
+        self.player_sessions: Dict[str, Dict[str, PlayerSession]] = {}  # guild_id -> player_id -> session
+        self.server_status: Dict[str, Dict[str, Dict[str, Any]]] = {}    # guild_id -> server_id -> status
+        self.sftp_connections: Dict[str, Dict[str, asyncssh.SSHClientConnection]] = {}  # guild_id -> {server_id}_{host}_{port} -> connection
+        self.file_states: Dict[str, Dict[str, FileState]] = {}          # guild_id -> server_id -> file_state
+        self.player_lifecycle: Dict[str, Dict[str, PlayerLifecycle]] = {} # guild_id -> player_id -> lifecycle
+
+        # Patterns are compiled once at import and shared by every instance
+        self.patterns = _PATTERNS
+        self.combined_pattern = _COMBINED_PATTERN
+
+        # pattern name -> (handler, group offset) so a match costs a single lookup
+        self._dispatch: Dict[str, Tuple[Any, int]] = {
+            name: (getattr(self, f'_handle_{name}'), _GROUP_OFFSETS[name]) for name in _HANDLED_PATTERNS
+        }
 
         # Complete mission normalization from real log data
-        self.mission_mappings = self._get_complete_mission_mappings()
+        self.mission_mappings = _MISSION_MAPPINGS
+        self._normalized_names: Dict[str, str] = {}  # mission_id -> readable name (ids are a small bounded set)
 
-        # Load persistent state on startup
-        asyncio.create_task(self._load_persistent_state())
+        # (guild_id, server_id) pairs with unsaved file state - persisted in batches by the state writer
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._flush_event = asyncio.Event()
+        self._state_flush_interval = 0.5  # seconds to coalesce updates before writing
+        self._state_retry_delay = self._state_flush_interval  # doubles after each failed write
 
-    def _compile_unified_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile all log patterns from actual Deadside.log analysis"""
-        return {
-            # SERVER LIFECYCLE
-            'log_rotation': re.compile(r'^Log file open, (\d{2}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})'),
-            'server_startup': re.compile(r'LogWorld: Bringing World.*up for play.*at (\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2})'),
-            'world_loaded': re.compile(r'LogLoad: Took .* seconds to LoadMap.*World_0'),
-            'server_max_players': re.compile(r'playersmaxcount=(\d+)', re.IGNORECASE),
-
-            # PLAYER CONNECTION LIFECYCLE - From actual log patterns
-            'player_queue_join': re.compile(r'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?.*eosid=\|([a-f0-9]+).*Name=([^&\?]+)', re.IGNORECASE),
-            'player_beacon_join': re.compile(r'LogBeacon: Beacon Join SFPSOnlineBeaconClient EOS:\|([a-f0-9]+)', re.IGNORECASE),
-            'player_registered': re.compile(r'LogOnline: Warning: Player \|([a-f0-9]+) successfully registered!', re.IGNORECASE),
-            'player_disconnect': re.compile(r'UChannel::Close: Sending CloseBunch.*UniqueId: EOS:\|([a-f0-9]+)', re.IGNORECASE),
-            'player_cleanup': re.compile(r'UNetConnection::Close: Connection cleanup.*UniqueId: EOS:\|([a-f0-9]+)', re.IGNORECASE),
-
-            # MISSION EVENTS - Patterns from actual Deadside.log
-            'mission_respawn': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) will respawn in (\d+)', re.IGNORECASE),
-            'mission_state_change': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to ([A-Z_]+)', re.IGNORECASE),
-            'mission_ready': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to READY', re.IGNORECASE),
-            'mission_initial': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to INITIAL', re.IGNORECASE),
-            'mission_in_progress': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to IN_PROGRESS', re.IGNORECASE),
-            'mission_completed': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to COMPLETED', re.IGNORECASE),
-
-            # VEHICLE EVENTS
-            'vehicle_spawn': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)', re.IGNORECASE),
-            'vehicle_delete': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)', re.IGNORECASE),
-
-            # TIMESTAMP EXTRACTION
-            'timestamp': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\]')
-        }
+        # Guilds whose voice channel player count changed during the current parse cycle
+        self._pending_voice_updates: Set[str] = set()
+        # Running voice updates - referenced here so they aren't garbage collected mid-run
+        self._voice_tasks: Set[asyncio.Task] = set()
 
-    def _get_complete_mission_mappings(self) -> Dict[str, str]:
-        """
-        Complete mission normalization from actual Deadside.log analysis
-        Maps all discovered mission IDs to proper readable names
-        """
-        return {
-            # Airport Missions
-            'GA_Airport_mis_01_SFPSACMission': 'Airport Mission #1',
-            'GA_Airport_mis_02_SFPSACMission': 'Airport Mission #2', 
-            'GA_Airport_mis_03_SFPSACMission': 'Airport Mission #3',
-            'GA_Airport_mis_04_SFPSACMission': 'Airport Mission #4',
-
-            # Settlement Missions
-            'GA_Beregovoy_Mis1': 'Beregovoy Settlement Mission',
-            'GA_Settle_05_ChernyLog_Mis1': 'Cherny Log Settlement Mission',
-            'GA_Settle_09_Mis_1': 'Settlement Mission #9',
-
-            # Military Base Missions
-            'GA_Military_02_Mis1': 'Military Base Mission #2',
-            'GA_Military_03_Mis_01': 'Military Base Mission #3',
-            'GA_Military_04_Mis1': 'Military Base Mission #4',
-            'GA_Military_04_Mis_2': 'Military Base Mission #4B',
-
-            # Industrial Missions
-            'GA_Ind_01_m1': 'Industrial Zone Mission #1',
-            'GA_Ind_02_Mis_1': 'Industrial Zone Mission #2',
-            'GA_PromZone_6_Mis_1': 'Industrial Zone Mission #6',
-            'GA_PromZone_Mis_01': 'Industrial Zone Mission A',
-            'GA_PromZone_Mis_02': 'Industrial Zone Mission B',
-
-            # Chemical Plant Missions
-            'GA_KhimMash_Mis_01': 'Chemical Plant Mission #1',
-            'GA_KhimMash_Mis_02': 'Chemical Plant Mission #2',
-
-            # City Missions
-            'GA_Kamensk_Ind_3_Mis_1': 'Kamensk Industrial Mission',
-            'GA_Kamensk_Mis_1': 'Kamensk City Mission #1',
-            'GA_Kamensk_Mis_2': 'Kamensk City Mission #2', 
-            'GA_Kamensk_Mis_3': 'Kamensk City Mission #3',
-            'GA_Krasnoe_Mis_1': 'Krasnoe City Mission',
-            'GA_Vostok_Mis_1': 'Vostok City Mission',
-
-            # Special Locations
-            'GA_Bunker_01_Mis1': 'Underground Bunker Mission',
-            'GA_Lighthouse_02_Mis1': 'Lighthouse Mission #2',
-            'GA_Elevator_Mis_1': 'Elevator Complex Mission #1',
-            'GA_Elevator_Mis_2': 'Elevator Complex Mission #2',
-
-            # Resource Missions
-            'GA_Sawmill_01_Mis1': 'Sawmill Mission #1',
-            'GA_Sawmill_02_1_Mis1': 'Sawmill Mission #2A',
-            'GA_Sawmill_03_Mis_01': 'Sawmill Mission #3',
-            'GA_Bochki_Mis_1': 'Barrel Storage Mission',
-            'GA_Dubovoe_0_Mis_1': 'Dubovoe Resource Mission',
-        }
+        # Embed sends started by parse_server_logs - awaited at the end of each run
+        self._send_tasks: Set[asyncio.Task] = set()
+        self._send_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SENDS)
+
+        # Guild configs for channel routing - guild_id -> (fetched_at monotonic, config)
+        self._guild_cfg_cache: Dict[int, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+        # Load persistent state on startup
+        asyncio.create_task(self._load_persistent_state())
+        self._state_writer_task = asyncio.create_task(self._state_writer_loop())
 
     def normalize_mission_name(self, mission_id: str) -> str:
         """
         Normalize mission ID to readable name
         Returns proper name from mapping or generates descriptive fallback
         """
+        name = self._normalized_names.get(mission_id)
+        if name is None:
+            name = self._normalized_names[mission_id] = self._build_mission_name(mission_id)
+        return name
+
+    def _build_mission_name(self, mission_id: str) -> str:
+        """Build the readable name for a mission ID"""
         if mission_id in self.mission_mappings:
             return self.mission_mappings[mission_id]
 
@@ -175,18 +368,9 @@ class UnifiedLogParser:
 
     def get_mission_level(self, mission_id: str) -> int:
         """Determine mission difficulty level based on type"""
-        if any(keyword in mission_id.lower() for keyword in ['military', 'bunker', 'khimmash']):
-            return 5  # High tier
-        elif any(keyword in mission_id.lower() for keyword in ['airport', 'promzone', 'kamensk']):
-            return 4  # High-medium tier
-        elif any(keyword in mission_id.lower() for keyword in ['ind_', 'industrial']):
-            return 3  # Medium tier
-        elif any(keyword in mission_id.lower() for keyword in ['sawmill', 'lighthouse', 'elevator']):
-            return 2  # Low-medium tier
-        else:
-            return 1  # Low tier
+        return _mission_tier(mission_id)
 
-    async def process_mission_event(self, guild_id: str, mission_id: str, state: str, respawn_time: Optional[int] = None) -> Optional[discord.Embed]:
+    def process_mission_event(self, guild_id: str, mission_id: str, state: str, respawn_time: Optional[int] = None) -> Optional[discord.Embed]:
         """
         Process mission event and create normalized embed
         Uses EmbedFactory for consistent formatting
@@ -195,256 +379,296 @@ class UnifiedLogParser:
             normalized_name = self.normalize_mission_name(mission_id)
             mission_level = self.get_mission_level(mission_id)
 
+            # Unknown states carrying a respawn timer are shown as respawns
+            embed_state = state if state in _MISSION_STATE_CFG or not respawn_time else 'RESPAWN'
+            title, template, color = _MISSION_STATE_CFG.get(embed_state, _DEFAULT_MISSION_CFG)
+
             # Create embed using EmbedFactory
-            if state == 'READY':
-                embed = EmbedFactory.create_mission_embed(
-                    title="🎯 Mission Available",
-                    description=f"**{normalized_name}** is now available for completion",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="READY",
-                    color=0x00FF00
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Mission Event • Powered by Discord.gg/EmeraldServers")
-            elif state == 'IN_PROGRESS':
-                embed = EmbedFactory.create_mission_embed(
-                    title="⚔️ Mission In Progress", 
-                    description=f"**{normalized_name}** is currently being completed",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="IN_PROGRESS",
-                    color=0xFFAA00
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Mission Event • Powered by Discord.gg/EmeraldServers")
-            elif state == 'COMPLETED':
-                embed = EmbedFactory.create_mission_embed(
-                    title="✅ Mission Completed",
-                    description=f"**{normalized_name}** has been completed successfully",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="COMPLETED",
-                    color=0x0099FF
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Mission Event • Powered by Discord.gg/EmeraldServers")
-            elif respawn_time:
-                embed = EmbedFactory.create_mission_embed(
-                    title="🔄 Mission Respawning",
-                    description=f"**{normalized_name}** will respawn in {respawn_time} seconds",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="RESPAWN",
-                    respawn_time=respawn_time,
-                    color=0x888888
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Mission Event • Powered by Discord.gg/EmeraldServers")
-            else:
-                embed = EmbedFactory.create_mission_embed(
-                    title="📋 Mission Update",
-                    description=f"**{normalized_name}** state: {state}",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state=state,
-                    color=0x666666
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Mission Event • Powered by Discord.gg/EmeraldServers")
+            embed = EmbedFactory.create_mission_embed(
+                title=title,
+                description=template.format(name=normalized_name, state=state, respawn_time=respawn_time),
+                mission_id=mission_id,
+                level=mission_level,
+                state=embed_state,
+                respawn_time=respawn_time,
+                color=color
+            )
+            # Add metadata for channel routing
+            embed.set_footer(text=_MISSION_FOOTER)
 
             return embed
 
         except Exception as e:
-            logger.error(f"Failed to process mission event: {e}")
+            logger.error("Failed to process mission event: %s", e)
             return None
 
-    async def process_player_connection(self, guild_id: str, player_id: str, player_name: str, event_type: str) -> Optional[discord.Embed]:
+    def process_player_connection(self, guild_id: str, player_id: str, player_name: str, event_type: str,
+                                  now_iso: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Process player connection event with unified lifecycle tracking
-        Uses EmbedFactory for consistent formatting
+        Returns the connection event; its embed is built only when it is sent
+        now_iso is the parse cycle timestamp, taken fresh when called outside a cycle
         """
         try:
+            now_iso = now_iso or datetime.now(timezone.utc).isoformat()
+
             # Update player session tracking
-            session_key = f"{guild_id}_{player_id}"
+            guild_sessions = self.player_sessions.setdefault(str(guild_id), {})
 
             if event_type == 'joined':
                 # Track player join
-                self.player_sessions[session_key] = {
-                    'player_id': player_id,
-                    'player_name': player_name,
-                    'guild_id': guild_id,
-                    'joined_at': datetime.now(timezone.utc).isoformat(),
-                    'status': 'online'
-                }
-
-                # Update voice channel with new player count
-                await self.update_voice_channel(guild_id)
-
-                embed = EmbedFactory.create_connection_embed(
-                    title="🟢 Player Connected",
-                    description=f"**{player_name}** has joined the server",
-                    player_name=player_name,
+                guild_sessions[player_id] = PlayerSession(
                     player_id=player_id,
-                    color=0x00FF00
+                    player_name=player_name,
+                    guild_id=guild_id,
+                    joined_at=now_iso
                 )
-                # Add metadata for channel routing
-                embed.set_footer(text="Connection Event • Powered by Discord.gg/EmeraldServers")
+                connection_type = 'player_connection'
 
             elif event_type == 'disconnected':
                 # Track player disconnect
-                if session_key in self.player_sessions:
-                    self.player_sessions[session_key]['status'] = 'offline'
-                    self.player_sessions[session_key]['left_at'] = datetime.now(timezone.utc).isoformat()
-
-                # Update voice channel with new player count
-                await self.update_voice_channel(guild_id)
-
-                embed = EmbedFactory.create_connection_embed(
-                    title="🔴 Player Disconnected", 
-                    description=f"**{player_name}** has left the server",
-                    player_name=player_name,
-                    player_id=player_id,
-                    color=0xFF0000
-                )
-                # Add metadata for channel routing
-                embed.set_footer(text="Connection Event • Powered by Discord.gg/EmeraldServers")
+                session = guild_sessions.get(player_id)
+                if session:
+                    session.status = 'offline'
+                    session.left_at = now_iso
+                connection_type = 'player_disconnection'
             else:
                 return None
 
+            # Voice channel player count is refreshed once at the end of the parse cycle
+            self._pending_voice_updates.add(str(guild_id))
+
+            return {
+                'type': connection_type,
+                'guild_id': guild_id,
+                'player_id': player_id,
+                'player_name': player_name
+            }
+
+        except Exception as e:
+            logger.error("Failed to process player connection: %s", e)
+            return None
+
+    def create_connection_embed(self, event_type: str, player_id: str, player_name: str) -> Optional[discord.Embed]:
+        """Create a player connection embed using EmbedFactory"""
+        try:
+            title, template, color = _CONNECTION_CFG[event_type]
+            embed = EmbedFactory.create_connection_embed(
+                title=title,
+                description=template.format(name=player_name),
+                player_name=player_name,
+                player_id=player_id,
+                color=color
+            )
+            # Add metadata for channel routing
+            embed.set_footer(text=_CONNECTION_FOOTER)
             return embed
 
         except Exception as e:
-            logger.error(f"Failed to process player connection: {e}")
+            logger.error("Failed to create connection embed: %s", e)
             return None
 
-    async def parse_log_content(self, content: str, guild_id: str, server_id: str) -> List[discord.Embed]:
+    def create_event_embed(self, event: Dict[str, Any]) -> Optional[discord.Embed]:
+        """Build the embed for a parsed log event"""
+        if event['type'] == 'mission_event':
+            return self.process_mission_event(
+                event['guild_id'], event['mission_id'], event['state'], event.get('respawn_time')
+            )
+        if event['type'] in _CONNECTION_CFG:
+            return self.create_connection_embed(event['type'], event['player_id'], event['player_name'])
+        return None
+
+    async def parse_log_content(self, content: bytes, guild_id: str, server_id: str) -> List[Dict[str, Any]]:
         """
-        Parse log content and return list of embeds for events
-        Unified processing of all log events with incremental tracking
+        Parse new log data and return the events found, as plain dicts -
+        embeds are only built for events that have a destination channel
+        content holds only the bytes appended since the stored byte offset;
+        the offset is advanced by len(content) once the data is accepted
         """
-        embeds = []
-        lines = content.splitlines()
-        total_lines = len(lines)
-
-        # Check for incremental processing (hot start)
-        server_key = f"{guild_id}_{server_id}"
-        stored_state = self.file_states.get(server_key, {})
-        last_processed = stored_state.get('line_count', 0)
-
-        # Only process new lines in hot start mode
-        if last_processed > 0 and last_processed < total_lines:
-            new_lines = lines[last_processed:]
-            logger.info(f"🔥 HOT START: Processing {len(new_lines)} new lines ({last_processed+1} to {total_lines})")
-            lines = new_lines
-        elif last_processed >= total_lines:
-            logger.info("📊 No new lines to process")
-            return embeds
-        else:
-            # First run or file reset - process all lines
-            logger.info(f"🆕 PROCESSING ALL LINES: {total_lines} total lines")
-
-        # Update file state BEFORE processing to prevent reprocessing
-        self.file_states[server_key] = {
-            'line_count': total_lines,
-            'last_updated': datetime.now(timezone.utc).isoformat()
-        }
-
-        # Save persistent state immediately
-        await self._save_persistent_state()
+        start_offset = self._stored_byte_offset(guild_id, server_id)
+        # One timestamp for the whole cycle - every event in it is stamped alike
+        cycle_now = datetime.now(timezone.utc).isoformat()
+
+        events, total_lines = self._parse_block(content, guild_id, server_id, cycle_now)
+        self._finish_cycle(events, total_lines, start_offset)
+        return events
+
+    def _stored_byte_offset(self, guild_id: str, server_id: str) -> int:
+        """Byte offset the next block of a server's log starts at"""
+        state = self.file_states.get(str(guild_id), {}).get(server_id)
+        return (state.byte_offset or 0) if state else 0
+
+    def _parse_block(self, content: bytes, guild_id: str, server_id: str,
+                     cycle_now: str) -> Tuple[List[Dict[str, Any]], int]:
+        """Parse one block of log data, advancing the byte offset - returns (events, line count)"""
+        # Per-guild state is keyed by str - handlers get the key ready to use
+        guild_id = str(guild_id)
+        events = []
+        # Lines are never materialized - only candidate lines are sliced out below
+        total_lines = _count_lines(content)
+        if not total_lines:
+            return events, 0
+
+        guild_states = self.file_states.setdefault(guild_id, {})
+        state = guild_states.get(server_id)
+        last_offset = (state.byte_offset or 0) if state else 0
+
+        # Update file state in place BEFORE processing to prevent reprocessing
+        if state is None:
+            state = guild_states[server_id] = FileState()
+        state.byte_offset = last_offset + len(content)
+        state.line_count += total_lines
+        state.last_updated = cycle_now
+
+        # Queue the state for the background writer
+        self._mark_state_dirty((guild_id, server_id))
 
         processed_events = 0
-        for line_idx, line in enumerate(lines):
+        safety_threshold = total_lines * 2
+        # Bound once per block instead of re-resolved for every candidate line
+        finditer = self.combined_pattern.finditer
+        dispatch = self._dispatch
+        for line in self._candidate_lines(content):
             try:
-                # Mission events
-                for pattern_name, pattern in self.patterns.items():
-                    if pattern_name.startswith('mission_'):
-                        match = pattern.search(line)
-                        if match:
-                            if pattern_name == 'mission_respawn':
-                                mission_id, respawn_time = match.groups()
-                                embed = await self.process_mission_event(
-                                    guild_id, mission_id, 'RESPAWN', int(respawn_time)
-                                )
-                            elif pattern_name == 'mission_state_change':
-                                mission_id, state = match.groups()
-                                embed = await self.process_mission_event(
-                                    guild_id, mission_id, state
-                                )
-                            else:
-                                continue
-
-                            if embed:
-                                embeds.append(embed)
-                                processed_events += 1
-                                logger.info(f"📋 Processed {pattern_name}: {mission_id if 'mission_id' in locals() else 'event'}")
-
-                            # Safety check - prevent massive embed generation
-                            if processed_events > len(lines) * 2:
-                                logger.error(f"⚠️ SAFETY BREAK: Generated {processed_events} events from {len(lines)} lines - stopping")
-                                break
-
-                # Player connection events - with name extraction
-                player_queue_join = self.patterns['player_queue_join'].search(line)
-                if player_queue_join:
-                    player_id, player_name = player_queue_join.groups()
-                    # Store name for later use when player registers
-                    player_key = f"{guild_id}_{player_id}"
-                    self.player_lifecycle[player_key] = {
-                        'name': player_name,
-                        'queue_joined': datetime.now(timezone.utc).isoformat()
-                    }
-
-                player_registered = self.patterns['player_registered'].search(line)
-                if player_registered:
-                    player_id = player_registered.group(1)
-                    player_key = f"{guild_id}_{player_id}"
-
-                    # Get player name from lifecycle tracking
-                    player_name = "Unknown Player"
-                    if player_key in self.player_lifecycle:
-                        player_name = self.player_lifecycle[player_key].get('name', 'Unknown Player')
-
-                    embed = await self.process_player_connection(
-                        guild_id, player_id, player_name, 'joined'
-                    )
-                    if embed:
-                        embeds.append(embed)
-                        processed_events += 1
+                for match in finditer(line):
+                    handler, offset = dispatch[match.lastgroup]
+                    event = handler(match, offset, guild_id, cycle_now)
 
-                player_disconnect = self.patterns['player_disconnect'].search(line)
-                if player_disconnect:
-                    player_id = player_disconnect.group(1)
-                    player_key = f"{guild_id}_{player_id}"
-
-                    # Get player name from session tracking
-                    session_key = f"{guild_id}_{player_id}"
-                    player_name = "Unknown Player"
-                    if session_key in self.player_sessions:
-                        player_name = self.player_sessions[session_key].get('player_name', 'Unknown Player')
-                    elif player_key in self.player_lifecycle:
-                        player_name = self.player_lifecycle[player_key].get('name', 'Unknown Player')
-
-                    embed = await self.process_player_connection(
-                        guild_id, player_id, player_name, 'disconnected'
-                    )
-                    if embed:
-                        embeds.append(embed)
+                    if event:
+                        events.append(event)
                         processed_events += 1
 
-                # Safety check after each line
-                if processed_events > len(lines) * 2:
-                    logger.error(f"⚠️ SAFETY BREAK: Generated {processed_events} events from {len(lines)} lines - stopping processing")
+                # Safety check - prevent massive embed generation
+                if processed_events > safety_threshold:
+                    logger.error("⚠️ SAFETY BREAK: Generated %d events from %d lines - stopping processing", processed_events, total_lines)
                     break
 
             except Exception as e:
-                logger.error(f"Error processing log line: {e}")
+                logger.error("Error processing log line: %s", e)
                 continue
 
-        # Final status logging
-        logger.info(f"🔍 Parser completed: found {len(embeds)} events from {len(lines)} new lines")
+        return events, total_lines
 
-        return embeds
+    def _finish_cycle(self, events: List[Dict[str, Any]], total_lines: int, start_offset: int):
+        """Log one summary per parse cycle and push the voice updates it queued"""
+        if not total_lines:
+            logger.info("📊 No new lines to process")
+            return
+        elif start_offset > 0:
+            logger.info("🔥 HOT START: Processed %d new lines from byte %d", total_lines, start_offset)
+        else:
+            # First run or file reset - all lines were processed
+            logger.info("🆕 PROCESSING ALL LINES: %d total lines", total_lines)
+
+        self._schedule_voice_updates()
+
+        # Final status logging - one summary line per cycle, per-event detail is debug only
+        mission_count = sum(1 for event in events if event['type'] == 'mission_event')
+        logger.info(
+            "🔍 Parser completed: found %d events (%d mission, %d player) from %d new lines",
+            len(events), mission_count, len(events) - mission_count, total_lines
+        )
+
+    def _candidate_lines(self, content: bytes) -> List[bytes]:
+        """
+        Return the lines of a block that can contain an event, in log order
+        Candidate positions come from bytes.find of each event literal; each
+        position is widened to its enclosing line so the combined pattern only
+        runs on lines that hit and the block is never split into a list of lines
+        """
+        spans: Dict[int, int] = {}  # line start -> line end
+        find, rfind = content.find, content.rfind
+
+        def line_end_at(pos: int) -> int:
+            line_start = rfind(b'\n', 0, pos) + 1
+            if line_start not in spans:
+                line_end = find(b'\n', pos)
+                spans[line_start] = line_end if line_end != -1 else len(content)
+            return spans[line_start]
+
+        for literal in _EVENT_LITERALS:
+            pos = find(literal)
+            while pos != -1:
+                pos = find(literal, line_end_at(pos))
+
+        return [content[start:spans[start]].rstrip(b'\r') for start in sorted(spans)]
+
+    def _handle_mission_respawn(self, match: re.Match, offset: int, guild_id: str, now_iso: str) -> Dict[str, Any]:
+        """Handle 'Mission X will respawn in N' lines"""
+        mission_id = match[offset + 1].decode('ascii')
+        logger.debug("📋 Processed mission_respawn: %s", mission_id)
+        return {
+            'type': 'mission_event',
+            'guild_id': guild_id,
+            'mission_id': mission_id,
+            'state': 'RESPAWN',
+            'respawn_time': int(match[offset + 2])
+        }
+
+    def _handle_mission_state_change(self, match: re.Match, offset: int, guild_id: str, now_iso: str) -> Dict[str, Any]:
+        """Handle 'Mission X switched to STATE' lines"""
+        mission_id = match[offset + 1].decode('ascii')
+        logger.debug("📋 Processed mission_state_change: %s", mission_id)
+        return {
+            'type': 'mission_event',
+            'guild_id': guild_id,
+            'mission_id': mission_id,
+            'state': match[offset + 2].decode('ascii'),
+            'respawn_time': None
+        }
+
+    def _handle_player_queue_join(self, match: re.Match, offset: int, guild_id: str, now_iso: str) -> None:
+        """Store player name from the join request for use when the player registers"""
+        player_id = match[offset + 1].decode('ascii')
+        player_name = match[offset + 2].decode('utf-8', 'replace')
+        self.player_lifecycle.setdefault(guild_id, {})[player_id] = PlayerLifecycle(
+            name=player_name,
+            queue_joined=now_iso
+        )
+        return None
+
+    def _handle_player_registered(self, match: re.Match, offset: int, guild_id: str, now_iso: str) -> Optional[Dict[str, Any]]:
+        """Handle successful player registration (player joined)"""
+        player_id = match[offset + 1].decode('ascii')
+
+        # Get player name from lifecycle tracking
+        player_name = "Unknown Player"
+        lifecycle = self.player_lifecycle.get(guild_id, {})
+        if player_id in lifecycle:
+            player_name = lifecycle[player_id].name
+
+        return self.process_player_connection(guild_id, player_id, player_name, 'joined', now_iso)
+
+    def _handle_player_disconnect(self, match: re.Match, offset: int, guild_id: str, now_iso: str) -> Optional[Dict[str, Any]]:
+        """Handle player channel close (player disconnected)"""
+        player_id = match[offset + 1].decode('ascii')
+
+        # Get player name from session tracking
+        player_name = "Unknown Player"
+        sessions = self.player_sessions.get(guild_id, {})
+        lifecycle = self.player_lifecycle.get(guild_id, {})
+        if player_id in sessions:
+            player_name = sessions[player_id].player_name
+        elif player_id in lifecycle:
+            player_name = lifecycle[player_id].name
+
+        return self.process_player_connection(guild_id, player_id, player_name, 'disconnected', now_iso)
+
+    async def parse_log_stream(self, blocks: AsyncIterator[bytes], guild_id: str, server_id: str) -> List[Dict[str, Any]]:
+        """Parse log data block by block as it is read, advancing the byte offset per block"""
+        start_offset = self._stored_byte_offset(guild_id, server_id)
+        cycle_now = datetime.now(timezone.utc).isoformat()
+
+        events = []
+        total_lines = 0
+        async for block in blocks:
+            block_events, block_lines = self._parse_block(block, guild_id, server_id, cycle_now)
+            events.extend(block_events)
+            total_lines += block_lines
+
+        # Logged once per poll, however many blocks the new data spanned
+        self._finish_cycle(events, total_lines, start_offset)
+        return events
 
     async def _load_persistent_state(self):
         """Load persistent state from database"""
@@ -456,8 +680,23 @@ class UnifiedLogParser:
                 state_doc = await self.bot.db_manager.db['parser_state'].find_one({'_id': 'unified_parser_state'})
 
                 if state_doc and 'file_states' in state_doc:
-                    self.file_states = state_doc['file_states']
-                    logger.info(f"Loaded persistent state for unified parser - {len(self.file_states)} server states")
+                    legacy_keys = False
+                    for key, value in state_doc['file_states'].items():
+                        if 'byte_offset' in value or 'line_count' in value:
+                            # Flat {guild_id}_{server_id} entry from before guild-keyed state
+                            guild_id, _, server_id = key.partition('_')
+                            self.file_states.setdefault(guild_id, {})[server_id] = FileState.from_dict(value)
+                            legacy_keys = True
+                        else:
+                            self.file_states.setdefault(key, {}).update(
+                                (server_id, FileState.from_dict(state)) for server_id, state in value.items()
+                            )
+
+                    if legacy_keys:
+                        await self._save_persistent_state()
+
+                    server_count = sum(len(servers) for servers in self.file_states.values())
+                    logger.info(f"Loaded persistent state for unified parser - {server_count} server states")
                 else:
                     logger.info("No persistent state found, starting fresh")
             else:
@@ -474,7 +713,7 @@ class UnifiedLogParser:
                 # Save file states to database
                 state_doc = {
                     '_id': 'unified_parser_state',
-                    'file_states': self.file_states,
+                    'file_states': self._file_states_doc(),
                     'last_updated': datetime.now(timezone.utc).isoformat()
                 }
 
@@ -483,89 +722,199 @@ class UnifiedLogParser:
                     state_doc,
                     upsert=True
                 )
-                logger.debug(f"Persistent state saved - {len(self.file_states)} server states")
+                logger.debug(f"Persistent state saved - {len(self.file_states)} guild states")
             else:
                 logger.debug("Database not available for state persistence")
         except Exception as e:
             logger.error(f"Failed to save persistent state: {e}")
 
-    def reset_file_states(self, server_key: Optional[str] = None, guild_id: Optional[int] = None):
+    def _file_states_doc(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """File states as plain dicts for storage and status output"""
+        return {
+            guild_id: {server_id: asdict(state) for server_id, state in servers.items()}
+            for guild_id, servers in self.file_states.items()
+        }
+
+    def _mark_state_dirty(self, *state_keys: Tuple[str, str]):
+        """Queue (guild_id, server_id) file states for the background writer"""
+        self._dirty.update(state_keys)
+        self._flush_event.set()
+
+    async def _state_writer_loop(self):
+        """Coalesce dirty file states and persist them in one write per batch"""
+        while True:
+            try:
+                await self._flush_event.wait()
+                await asyncio.sleep(self._state_flush_interval)
+                self._flush_event.clear()
+
+                state_keys, self._dirty = self._dirty, set()
+                if state_keys:
+                    try:
+                        saved = await self._write_dirty_states(state_keys)
+                    except asyncio.CancelledError:
+                        # Stopped mid-write - hand the batch back so flush_state() writes it
+                        self._dirty.update(state_keys)
+                        raise
+
+                    if saved:
+                        self._state_retry_delay = self._state_flush_interval
+                    else:
+                        # Back off before retrying so an unreachable database isn't hammered
+                        await asyncio.sleep(self._state_retry_delay)
+                        self._state_retry_delay = min(self._state_retry_delay * 2, _STATE_RETRY_MAX_DELAY)
+                        self._flush_event.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("State writer error: %s", e)
+
+    async def _write_dirty_states(self, state_keys: Set[Tuple[str, str]]) -> bool:
+        """Persist only the changed file states, unsetting any that were reset - True once written"""
+        if not (hasattr(self.bot, 'db_manager') and self.bot.db_manager):
+            logger.debug("Database not available for state persistence")
+            return False
+
+        set_fields: Dict[str, Any] = {'last_updated': datetime.now(timezone.utc).isoformat()}
+        unset_fields: Dict[str, str] = {}
+        for guild_id, server_id in state_keys:
+            state = self.file_states.get(guild_id, {}).get(server_id)
+            if state is not None:
+                set_fields[f'file_states.{guild_id}.{server_id}'] = asdict(state)
+            else:
+                unset_fields[f'file_states.{guild_id}.{server_id}'] = ''
+
+        update: Dict[str, Any] = {'$set': set_fields}
+        if unset_fields:
+            update['$unset'] = unset_fields
+
+        try:
+            await self.bot.db_manager.db['parser_state'].update_one(
+                {'_id': 'unified_parser_state'},
+                update,
+                upsert=True
+            )
+            logger.debug("Persistent state saved - %d server states", len(state_keys))
+            return True
+        except Exception as e:
+            # Keep the keys so the writer retries them after its backoff
+            self._dirty.update(state_keys)
+            logger.error("Failed to save persistent state: %s", e)
+            return False
+
+    async def flush_state(self):
+        """Stop the state writer and persist every pending file state - call on shutdown"""
+        if not self._state_writer_task.done():
+            self._state_writer_task.cancel()
+            try:
+                await self._state_writer_task
+            except asyncio.CancelledError:
+                pass
+
+        state_keys, self._dirty = self._dirty, set()
+        if state_keys and await self._write_dirty_states(state_keys):
+            logger.info("Flushed %d pending parser states", len(state_keys))
+
+    def reset_file_states(self, guild_id: Optional[int] = None, server_id: Optional[str] = None):
         """Reset file states to force cold start on next run"""
-        if server_key:
-            if server_key in self.file_states:
-                del self.file_states[server_key]
-                logger.info(f"Reset file state for {server_key}")
-        elif guild_id:
+        if guild_id is not None and server_id:
+            guild_states = self.file_states.get(str(guild_id), {})
+            if server_id in guild_states:
+                del guild_states[server_id]
+                self._mark_state_dirty((str(guild_id), server_id))
+                logger.info(f"Reset file state for {guild_id}_{server_id}")
+        elif guild_id is not None:
             # Reset all states for a specific guild
-            guild_prefix = f"{guild_id}_"
-            keys_to_remove = [k for k in self.file_states.keys() if k.startswith(guild_prefix)]
-            for key in keys_to_remove:
-                del self.file_states[key]
-            logger.info(f"Reset all file states for guild {guild_id} ({len(keys_to_remove)} servers)")
+            guild_states = self.file_states.pop(str(guild_id), {})
+            self._mark_state_dirty(*((str(guild_id), sid) for sid in guild_states))
+            logger.info(f"Reset all file states for guild {guild_id} ({len(guild_states)} servers)")
         else:
+            self._mark_state_dirty(*((gid, sid) for gid, servers in self.file_states.items() for sid in servers))
             self.file_states.clear()
             logger.info("Reset all file states")
 
     def get_guild_server_state(self, guild_id: int, server_id: str) -> Dict[str, Any]:
         """Get isolated state for a specific guild-server combination"""
-        server_key = f"{guild_id}_{server_id}"
+        guild_key = str(guild_id)
+        file_state = self.file_states.get(guild_key, {}).get(server_id)
         return {
-            'file_state': self.file_states.get(server_key, {}),
-            'server_status': self.server_status.get(server_key, {}),
+            'file_state': asdict(file_state) if file_state else {},
+            'server_status': self.server_status.get(guild_key, {}).get(server_id, {}),
             'active_players': [
-                session for session_key, session in self.player_sessions.items()
-                if session_key.startswith(f"{guild_id}_") and session.get('status') == 'online'
+                asdict(session) for session in self.player_sessions.get(guild_key, {}).values()
+                if session.status == 'online'
             ],
             'sftp_connected': any(
-                conn_key.startswith(f"{guild_id}_{server_id}_") 
-                for conn_key in self.sftp_connections.keys()
+                conn_key.startswith(f"{server_id}_")
+                for conn_key in self.sftp_connections.get(guild_key, {})
             )
         }
 
     def cleanup_guild_state(self, guild_id: int):
         """Clean up all state for a guild (when bot leaves guild)"""
-        guild_prefix = f"{guild_id}_"
+        guild_key = str(guild_id)
 
         # Clean up all state dictionaries
-        for state_dict in [self.file_states, self.player_sessions, self.server_status, 
-                          self.player_lifecycle, self.last_log_position, self.log_file_hashes]:
-            keys_to_remove = [k for k in state_dict.keys() if k.startswith(guild_prefix)]
-            for key in keys_to_remove:
-                del state_dict[key]
+        removed_states = self.file_states.pop(guild_key, {})
+        self._mark_state_dirty(*((guild_key, server_id) for server_id in removed_states))
+        for state_dict in [self.player_sessions, self.server_status, self.player_lifecycle,
+                           self.last_log_position, self.log_file_hashes]:
+            state_dict.pop(guild_key, None)
 
         # Close SFTP connections for this guild
-        conn_keys_to_remove = [k for k in self.sftp_connections.keys() if k.startswith(guild_prefix)]
-        for conn_key in conn_keys_to_remove:
+        for conn in self.sftp_connections.pop(guild_key, {}).values():
             try:
-                self.sftp_connections[conn_key].close()
+                conn.close()
             except:
                 pass
-            del self.sftp_connections[conn_key]
 
         logger.info(f"Cleaned up all state for guild {guild_id}")
 
     def get_parser_status(self) -> Dict[str, Any]:
         """Get parser status for debugging"""
-        active_sessions = sum(1 for session in self.player_sessions.values() if session.get('status') == 'online')
+        active_sessions = sum(
+            1 for sessions in self.player_sessions.values()
+            for session in sessions.values() if session.status == 'online'
+        )
+        sftp_connections = sum(len(conns) for conns in self.sftp_connections.values())
 
         return {
             'active_sessions': active_sessions,
-            'total_tracked_servers': len(self.file_states),
-            'sftp_connections': len(self.sftp_connections),
-            'file_states': {k: v for k, v in self.file_states.items()},
-            'connection_status': 'healthy' if self.sftp_connections else 'no_connections'
+            'total_tracked_servers': sum(len(servers) for servers in self.file_states.values()),
+            'sftp_connections': sftp_connections,
+            'file_states': self._file_states_doc(),
+            'connection_status': 'healthy' if sftp_connections else 'no_connections'
         }
 
+    def _schedule_voice_updates(self):
+        """Fire one voice channel update per guild touched in this cycle"""
+        for guild_id in self._pending_voice_updates:
+            task = asyncio.create_task(self.update_voice_channel(guild_id))
+            self._voice_tasks.add(task)
+            task.add_done_callback(self._voice_tasks.discard)
+        self._pending_voice_updates.clear()
+
     async def update_voice_channel(self, guild_id: str):
         """Update voice channel player count (placeholder for future implementation)"""
         # TODO: Implement voice channel player count updates
         # This would require channel configuration and Discord API calls
         pass
 
+    def invalidate_guild_cfg(self, guild_id: int):
+        """Drop the cached guild config so the next lookup reads the database"""
+        self._guild_cfg_cache.pop(guild_id, None)
+
     async def get_server_channel(self, guild_id: int, server_id: str, channel_type: str) -> Optional[int]:
         """Get server-specific channel ID with fallback logic"""
         try:
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
+            now = time.monotonic()
+            cached = self._guild_cfg_cache.get(guild_id)
+            if cached and now - cached[0] < _GUILD_CFG_TTL:
+                guild_config = cached[1]
+            else:
+                guild_config = await self.bot.db_manager.get_guild(guild_id)
+                self._guild_cfg_cache[guild_id] = (now, guild_config)
+
             if not guild_config:
                 return None
 
@@ -587,13 +936,13 @@ class UnifiedLogParser:
             return guild_config.get('channels', {}).get(channel_type)
 
         except Exception as e:
-            logger.error(f"Failed to get {channel_type} channel for guild {guild_id}, server {server_id}: {e}")
+            logger.error("Failed to get %s channel for guild %s, server %s: %s", channel_type, guild_id, server_id, e)
             return None
 
-    async def send_log_embeds(self, guild_id: int, server_id: str, embeds_data: List[Dict[str, Any]]):
-        """Send log embeds to appropriate channels based on event type with server-specific routing"""
+    async def send_log_embeds(self, guild_id: int, server_id: str, events: List[Dict[str, Any]]):
+        """Send log events to appropriate channels based on event type with server-specific routing"""
         try:
-            if not embeds_data:
+            if not events:
                 return
 
             # Channel mapping for different event types
@@ -607,55 +956,59 @@ class UnifiedLogParser:
                 'player_disconnection': 'connections'
             }
 
-            for embed_data in embeds_data:
-                embed_type = embed_data.get('type')
-                channel_type = channel_mapping.get(embed_type)
+            # Group embeds by destination so each channel gets one message per 10 embeds
+            by_channel: Dict[Any, List[discord.Embed]] = defaultdict(list)
+            channels: Dict[str, Any] = {}  # channel_type -> channel for this call
+
+            for event in events:
+                event_type = event.get('type')
+                channel_type = channel_mapping.get(event_type)
 
                 if not channel_type:
-                    logger.warning(f"Unknown embed type: {embed_type}")
+                    logger.warning("Unknown event type: %s", event_type)
                     continue
 
                 # Get server-specific channel with fallback
-                channel_id = await self.get_server_channel(guild_id, server_id, channel_type)
-                if not channel_id:
-                    logger.debug(f"No {channel_type} channel configured for guild {guild_id}, server {server_id}")
-                    continue
+                if channel_type not in channels:
+                    channels[channel_type] = await self._resolve_channel(guild_id, server_id, channel_type)
 
-                channel = self.bot.get_channel(channel_id)
+                channel = channels[channel_type]
                 if not channel:
-                    logger.warning(f"Channel {channel_id} not found for {channel_type}")
                     continue
 
-                try:
-                    await channel.send(embed=discord.Embed.from_dict(embed_data.get('embed')))
-                    logger.info(f"Sent {channel_type} event to {channel.name} (ID: {channel_id})")
-                except Exception as e:
-                    logger.error(f"Failed to send {channel_type} event to channel {channel_id}: {e}")
+                # Only events with a destination pay for embed construction
+                embed = self.create_event_embed(event)
+                if embed:
+                    by_channel[channel].append(embed)
+
+            await self._send_embed_batches(by_channel)
 
         except Exception as e:
             logger.error(f"Failed to send log embeds: {e}")
 
-    def _determine_channel_type(self, embed: discord.Embed) -> Optional[str]:
-        """Determine which channel type an embed should go to based on its content"""
-        if not embed.title:
+    async def _resolve_channel(self, guild_id: int, server_id: str, channel_type: str):
+        """Resolve the Discord channel for a channel type, or None if unavailable"""
+        channel_id = await self.get_server_channel(guild_id, server_id, channel_type)
+        if not channel_id:
+            logger.debug("No %s channel configured for guild %s, server %s", channel_type, guild_id, server_id)
             return None
 
-        title_lower = embed.title.lower()
-
-        # Map embed types to channel types
-        if any(keyword in title_lower for keyword in ['airdrop', 'crate']):
-            return 'events'
-        elif any(keyword in title_lower for keyword in ['mission', 'objective']):
-            return 'events'
-        elif any(keyword in title_lower for keyword in ['helicopter', 'heli', 'crash']):
-            return 'events'
-        elif any(keyword in title_lower for keyword in ['connect', 'disconnect', 'join', 'left']):
-            return 'connections'
-        elif any(keyword in title_lower for keyword in ['bounty']):
-            return 'bounties'
-        else:
-            # Default to events for most server activities
-            return 'events'
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            logger.warning("Channel %s not found for %s", channel_id, channel_type)
+        return channel
+
+    async def _send_embed_batches(self, by_channel: Dict[Any, List[discord.Embed]]):
+        """Send grouped embeds with one API request per 10 embeds per channel"""
+        for channel, embeds in by_channel.items():
+            for i in range(0, len(embeds), _EMBEDS_PER_MESSAGE):
+                batch = embeds[i:i + _EMBEDS_PER_MESSAGE]
+                try:
+                    async with self._send_semaphore:
+                        await channel.send(embeds=batch)
+                    logger.info("Sent %d events to %s (ID: %s)", len(batch), channel.name, channel.id)
+                except Exception as e:
+                    logger.error("Failed to send %d events to channel %s: %s", len(batch), channel.id, e)
 
     async def run_log_parser(self):
         """Main parsing method - unified entry point with cold/hot start detection"""
@@ -675,10 +1028,13 @@ class UnifiedLogParser:
                     logger.info("No guilds found in database")
                     return
 
-                total_servers_processed = 0
+                # Servers are independent, so their reads and sends overlap
+                semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SERVERS)
+                servers_to_parse = []
+                tasks = []
 
                 for guild_doc in guilds_list:
-                    guild_id = guild_doc.get('_id')
+                    guild_id = guild_doc.get('guild_id')
                     guild_name = guild_doc.get('name', 'Unknown')
                     servers = guild_doc.get('servers', [])
 
@@ -689,12 +1045,21 @@ class UnifiedLogParser:
                     logger.info(f"Processing {len(servers)} servers for guild: {guild_name}")
 
                     for server in servers:
-                        try:
-                            await self.parse_server_logs(guild_id, server)
-                            total_servers_processed += 1
-                        except Exception as e:
-                            logger.error(f"Failed to parse logs for server {server.get('name', 'Unknown')}: {e}")
-                            continue
+                        servers_to_parse.append(server)
+                        tasks.append(self._parse_server_logs_limited(semaphore, guild_id, server))
+
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                total_servers_processed = 0
+                for server, result in zip(servers_to_parse, results):
+                    if isinstance(result, Exception):
+                        logger.error("Failed to parse logs for server %s: %s", server.get('name', 'Unknown'), result)
+                    else:
+                        total_servers_processed += 1
+
+                # Let the embed sends started during this run finish
+                if self._send_tasks:
+                    await asyncio.gather(*self._send_tasks, return_exceptions=True)
 
                 logger.info(f"✅ Unified parser completed - processed {total_servers_processed} servers")
 
@@ -704,6 +1069,11 @@ class UnifiedLogParser:
         except Exception as e:
             logger.error(f"Unified log parser failed: {e}")
 
+    async def _parse_server_logs_limited(self, semaphore: asyncio.Semaphore, guild_id: int, server: dict):
+        """Parse one server's logs once a concurrency slot is free"""
+        async with semaphore:
+            await self.parse_server_logs(guild_id, server)
+
     async def parse_server_logs(self, guild_id: int, server: dict):
         """Parse logs for a specific server"""
         try:
@@ -719,57 +1089,83 @@ class UnifiedLogParser:
             log_path = f'./{host}_{server_id}/Logs/Deadside.log'
 
             try:
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if not content.strip():
-                    logger.debug(f"Empty log file for {server_name}")
+                byte_offset = await self._resolve_byte_offset(log_path, str(guild_id), server_id)
+                if byte_offset is None:
+                    logger.debug("No new log data for %s", server_name)
                     return
 
-                # Parse log content and get embeds
-                embeds = await self.parse_log_content(content, str(guild_id), server_id)
-
-                if embeds:
-                    # Send embeds to appropriate channels
-                    for embed in embeds:
-                        # Determine channel type from embed content
-                        channel_type = self._determine_channel_type(embed)
-                        if channel_type:
-                            # Get channel for this server
-                            channel_id = await self.get_server_channel(guild_id, server_id, channel_type)
-                            if channel_id:
-                                channel = self.bot.get_channel(channel_id)
-                                if channel:
-                                    try:
-                                        await channel.send(embed=embed)
-                                        logger.debug(f"Sent {channel_type} embed to {channel.name}")
-                                    except Exception as e:
-                                        logger.error(f"Failed to send embed: {e}")
+                # Stream the appended data through the parser and get events
+                events = await self.parse_log_stream(
+                    self._read_log_blocks(log_path, byte_offset), str(guild_id), server_id
+                )
+
+                if events:
+                    # Send events to their server-specific channels in the background,
+                    # so Discord round trips overlap with parsing the next server
+                    task = asyncio.create_task(self.send_log_embeds(guild_id, server_id, events))
+                    self._send_tasks.add(task)
+                    task.add_done_callback(self._send_tasks.discard)
 
             except FileNotFoundError:
-                logger.debug(f"Log file not found: {log_path}")
+                logger.debug("Log file not found: %s", log_path)
             except Exception as e:
-                logger.error(f"Error reading log file {log_path}: {e}")
+                logger.error("Error reading log file %s: %s", log_path, e)
 
         except Exception as e:
             logger.error(f"Error parsing server logs: {e}")
 
-    async def _process_cold_start(self, content: str, guild_id: str, server_id: str):
-        """Process cold start - parse without generating embeds"""
-        try:
-            lines = content.splitlines()
-            server_key = f"{guild_id}_{server_id}"
+    async def _resolve_byte_offset(self, log_path: str, guild_id: str, server_id: str) -> Optional[int]:
+        """
+        Return the offset to resume reading from, resetting on log rotation
+        Returns None without opening the file when its size and mtime match
+        the last poll and everything up to that size was read.
+        Rotation is detected by a shrinking file or a changed hash of the first
+        64 bytes; states saved before byte tracking are converted from line_count
+        """
+        guild_states = self.file_states.setdefault(guild_id, {})
+        state = guild_states.get(server_id) or FileState()
 
-            # Update file state without processing events
-            self.file_states[server_key] = {
-                'line_count': len(lines),
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            }
+        file_stat = await aiofiles.os.stat(log_path)
+        file_size = file_stat.st_size
+        if state.byte_offset == file_size and state.mtime == file_stat.st_mtime:
+            return None
+
+        async with aiofiles.open(log_path, 'rb') as f:
+            head = await f.read(64)
+            head_hash = hashlib.md5(head).hexdigest() if len(head) == 64 else None
 
-            # Save persistent state
-            await self._save_persistent_state()
+            if state.byte_offset is None and state.line_count:
+                # Legacy line-count state - skip the lines already processed
+                await f.seek(0)
+                byte_offset = _offset_after_lines(await f.read(), state.line_count)
+            else:
+                byte_offset = state.byte_offset or 0
 
-            logger.info(f"🧊 Cold start completed - tracked {len(lines)} lines for future processing")
+        stored_hash = state.head_hash
+        if byte_offset > file_size or (stored_hash and head_hash and stored_hash != head_hash):
+            logger.info("🔄 Log rotation detected for %s_%s - restarting from beginning", guild_id, server_id)
+            state = FileState()
+            byte_offset = 0
 
-        except Exception as e:
-            logger.error(f"Error in cold start processing: {e}")
\ No newline at end of file
+        state.byte_offset = byte_offset
+        state.head_hash = head_hash
+        state.mtime = file_stat.st_mtime
+        guild_states[server_id] = state
+        return byte_offset
+
+    async def _read_log_blocks(self, log_path: str, byte_offset: int) -> AsyncIterator[bytes]:
+        """
+        Yield the complete lines appended after byte_offset in ~1 MiB blocks
+        Every block ends on a line boundary; a trailing line that is still being
+        written is left unread so the offset stays on a line boundary and the
+        line is parsed whole on a later poll
+        """
+        async with aiofiles.open(log_path, 'rb') as f:
+            await f.seek(byte_offset)
+            buffer = b''
+            while chunk := await f.read(_READ_CHUNK_SIZE):
+                buffer += chunk
+                cut = buffer.rfind(b'\n') + 1
+                if cut:
+                    yield buffer[:cut]
+                    buffer = buffer[cut:]
@@ -46,9 +46,9 @@ async def final_validation():
         with open(log_path, 'r') as f:
             content = f.read()
         
-        embeds = await parser.parse_log_content(content, "test_guild")
+        events = await parser.parse_log_content(content.encode('utf-8'), "test_guild", server_id)
         print(f"   Log Lines Processed: {len(content.splitlines())}")
-        print(f"   Events Generated: {len(embeds)}")
+        print(f"   Events Generated: {len(events)}")
         print(f"   Parse Success: ✅")
     
     # Test 3: Verify mission processing
@@ -71,7 +71,7 @@ async def final_validation():
     
     # Test 4: Verify EmbedFactory integration
     print("\n✅ REQUIREMENT 4: All outputs use EmbedFactory with themed formatting")
-    embed = await parser.process_mission_event("test", "GA_Airport_mis_01_SFPSACMission", "READY")
+    embed = parser.process_mission_event("test", "GA_Airport_mis_01_SFPSACMission", "READY")
     has_embed = embed is not None
     print(f"   EmbedFactory Integration: {'✅' if has_embed else '❌'}")
     
@@ -689,15 +689,14 @@ class EmeraldKillfeedBot(commands.Bot):
         # Clean up SFTP connections
         await self.cleanup_connections()
 
-        # Shutdown log parser to save state
-        if hasattr(self, 'unified_log_parser') and self.unified_log_parser:
-            # Unified parser cleanup handled in close() method
-            pass
-
         if self.scheduler.running:
             self.scheduler.shutdown()
             logger.info("Scheduler stopped")
 
+        # Persist pending log parser state once no parse job can be scheduled
+        if hasattr(self, 'unified_log_parser') and self.unified_log_parser:
+            await self.unified_log_parser.flush_state()
+
         if hasattr(self, 'mongo_client') and self.mongo_client:
             self.mongo_client.close()
             logger.info("MongoDB connection closed")
@@ -717,15 +716,14 @@ class EmeraldKillfeedBot(commands.Bot):
             # Clean up SFTP connections
             await self.cleanup_connections()
 
-            # Shutdown log parser to save state
-            if hasattr(self, 'unified_log_parser') and self.unified_log_parser:
-                # Unified parser cleanup handled in close() method
-                pass
-
             if self.scheduler.running:
                 self.scheduler.shutdown()
                 logger.info("Scheduler stopped")
 
+            # Persist pending log parser state once no parse job can be scheduled
+            if hasattr(self, 'unified_log_parser') and self.unified_log_parser:
+                await self.unified_log_parser.flush_state()
+
             if hasattr(self, 'mongo_client') and self.mongo_client:
                 self.mongo_client.close()
                 logger.info("MongoDB connection closed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test Case-Sensitive Event Patterns
+Verify the combined event pattern still matches the /test_log_parser sample
+lines and EOS ids in any letter case now that the handled patterns are
+compiled without re.IGNORECASE
+"""
+
+import asyncio
+import logging
+from bot.parsers.unified_log_parser import UnifiedLogParser
+
+# Suppress logs for clean test output
+logging.getLogger().setLevel(logging.CRITICAL)
+
+class MockBot:
+    """Mock bot for testing"""
+    def __init__(self):
+        pass
+
+# Sample lines from the /test_log_parser command in bot/cogs/parsers.py
+SAMPLE_LOGS = [
+    "[2024.05.30-09.18.36:173] LogSFPS: Mission GA_Airport_mis_01_SFPSACMission switched to READY",
+    "[2024.05.30-09.18.37:174] LogNet: Join request: /Game/Maps/world_1/World_1?eosid=|abc123def456?Name=TestPlayer",
+    "[2024.05.30-09.18.38:175] LogOnline: Warning: Player |abc123def456 successfully registered!",
+    "[2024.05.30-09.18.39:176] LogSFPS: Mission GA_Military_02_Mis1 switched to IN_PROGRESS",
+    "[2024.05.30-09.18.40:177] UChannel::Close: Sending CloseBunch UniqueId: EOS:|abc123def456"
+]
+
+# EOS ids are hex and appear in logs in either letter case
+EOS_IDS = ['ABC123DEF456', 'AbC123dEf456', '0002d4f1a7b84c2e9F3E5B6C7D8A9B0C']
+
+def player_lines(eos_id: str) -> list:
+    """Join, registered and disconnect lines for one player"""
+    return [
+        f"[2024.05.30-09.19.00:100] LogNet: Join request: /Game/Maps/world_1/World_1?eosid=|{eos_id}?Name=Player_{eos_id[:4]}",
+        f"[2024.05.30-09.19.01:101] LogOnline: Warning: Player |{eos_id} successfully registered!",
+        f"[2024.05.30-09.19.02:102] UChannel::Close: Sending CloseBunch UniqueId: EOS:|{eos_id}"
+    ]
+
+async def test_case_sensitive_patterns():
+    """Test that case-sensitive patterns match real log lines"""
+    print("🔠 Testing Case-Sensitive Event Patterns")
+    print("=" * 50)
+
+    parser = UnifiedLogParser(MockBot())
+    failures = 0
+
+    print("📋 Sample log lines:")
+    expected_groups = ['mission_state_change', 'player_queue_join', 'player_registered',
+                       'mission_state_change', 'player_disconnect']
+    for line, expected in zip(SAMPLE_LOGS, expected_groups):
+        match = parser.combined_pattern.search(line.encode('utf-8'))
+        matched = match.lastgroup if match else None
+        if matched == expected:
+            print(f"  ✅ {expected}")
+        else:
+            print(f"  ❌ expected {expected}, got {matched}: {line}")
+            failures += 1
+
+    events = await parser.parse_log_content("\n".join(SAMPLE_LOGS).encode('utf-8'), "test_guild", "sample_server")
+    event_types = [event['type'] for event in events]
+    expected_types = ['mission_event', 'player_connection', 'mission_event', 'player_disconnection']
+    if event_types == expected_types:
+        print(f"  ✅ Sample events: {event_types}")
+    else:
+        print(f"  ❌ Sample events: {event_types} (expected {expected_types})")
+        failures += 1
+
+    print("\n👥 Mixed-case EOS ids:")
+    for eos_id in EOS_IDS:
+        content = "\n".join(player_lines(eos_id)).encode('utf-8')
+        events = await parser.parse_log_content(content, "test_guild", f"server_{eos_id}")
+        player_events = [(event['type'], event['player_id'], event['player_name']) for event in events]
+        expected_events = [
+            ('player_connection', eos_id, f"Player_{eos_id[:4]}"),
+            ('player_disconnection', eos_id, f"Player_{eos_id[:4]}")
+        ]
+        if player_events == expected_events:
+            print(f"  ✅ {eos_id}: connect and disconnect with name")
+        else:
+            print(f"  ❌ {eos_id}: {player_events}")
+            failures += 1
+
+    print()
+    if failures:
+        print(f"❌ {failures} pattern checks failed")
+    else:
+        print("✅ All case-sensitive pattern checks passed")
+    return failures == 0
+
+if __name__ == "__main__":
+    success = asyncio.run(test_case_sensitive_patterns())
+    raise SystemExit(0 if success else 1)
@@ -82,7 +82,7 @@ async def test_mission_normalization():
     
     sample_missions = list(missions)[:3]
     for mission_id in sample_missions:
-        embed = await parser.process_mission_event("test_guild", mission_id, "READY")
+        embed = parser.process_mission_event("test_guild", mission_id, "READY")
         if embed:
             print(f"✅ {mission_id}: Embed created successfully")
             print(f"   Title: {embed.title}")
@@ -67,10 +67,10 @@ async def test_path_correction():
     with open(test_log_path, 'r') as f:
         content = f.read()
     
-    embeds = await parser.parse_log_content(content, "test_guild")
+    events = await parser.parse_log_content(content.encode('utf-8'), "test_guild", server_id)
     
     print(f"  Sample Content Parsed: {len(content.splitlines())} lines")
-    print(f"  Embeds Generated: {len(embeds)}")
+    print(f"  Events Generated: {len(events)}")
     
     # Test mission normalization
     test_mission = "GA_Airport_mis_01_SFPSACMission"